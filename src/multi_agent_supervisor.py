@@ -135,7 +135,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     """
     supervisor_messages = state.get("supervisor_messages", [])
     research_iterations = state.get("research_iterations", 0)
-    most_recent_message = supervisor_messages[-1]
+    research_brief = state.get("research_brief", "")
+    most_recent_tool_calls = supervisor_messages[-1].tool_calls
 
     # Initialize variables for single return pattern
     tool_messages = []
@@ -146,11 +147,22 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
     # Check exit criteria first
     exceeded_iterations = research_iterations >= max_researcher_iterations
-    no_tool_calls = not most_recent_message.tool_calls
-    research_complete = any(
-        tool_call["name"] == "ResearchComplete" 
-        for tool_call in most_recent_message.tool_calls
-    )
+    no_tool_calls = not most_recent_tool_calls
+
+    # Group tool calls by name in a single pass over the message's tool calls
+    tool_calls_by_name = {
+        "think_tool": [],
+        "ConductResearch": [],
+        "refine_draft_report": [],
+        "ResearchComplete": [],
+    }
+    for tool_call in most_recent_tool_calls:
+        tool_calls_by_name.setdefault(tool_call["name"], []).append(tool_call)
+
+    think_tool_calls = tool_calls_by_name["think_tool"]
+    conduct_research_calls = tool_calls_by_name["ConductResearch"]
+    refine_report_calls = tool_calls_by_name["refine_draft_report"]
+    research_complete = bool(tool_calls_by_name["ResearchComplete"])
 
     if exceeded_iterations or no_tool_calls or research_complete:
         should_end = True
@@ -159,22 +171,6 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     else:
         # Execute ALL tool calls before deciding next step
         try:
-            # Separate think_tool calls from ConductResearch calls
-            think_tool_calls = [
-                tool_call for tool_call in most_recent_message.tool_calls 
-                if tool_call["name"] == "think_tool"
-            ]
-
-            conduct_research_calls = [
-                tool_call for tool_call in most_recent_message.tool_calls 
-                if tool_call["name"] == "ConductResearch"
-            ]
-
-            refine_report_calls = [
-                tool_call for tool_call in most_recent_message.tool_calls 
-                if tool_call["name"] == "refine_draft_report"
-            ]
-
             # Handle think_tool calls (synchronous)
             for tool_call in think_tool_calls:
                 observation = think_tool.invoke(tool_call["args"])
@@ -222,12 +218,13 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                     for result in tool_results
                 ]
 
-            for tool_call in refine_report_calls: 
-              notes = get_notes_from_tool_calls(supervisor_messages)    
-              findings = "\n".join(notes)
+            # Findings only depend on messages already in state, so build them once
+            if refine_report_calls:
+              findings = "\n".join(get_notes_from_tool_calls(supervisor_messages))
 
+            for tool_call in refine_report_calls: 
               draft_report = refine_draft_report.invoke({
-                    "research_brief": state.get("research_brief", ""),
+                    "research_brief": research_brief,
                     "findings": findings,
                     "draft_report": state.get("draft_report", "")
               })
@@ -250,7 +247,7 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
             goto=next_step,
             update={
                 "notes": get_notes_from_tool_calls(supervisor_messages),
-                "research_brief": state.get("research_brief", "")
+                "research_brief": research_brief
             }
         )
     elif len(refine_report_calls) > 0:
@@ -0,0 +1,69 @@
+"""Optional Prompt Compression.
+
+This module shrinks long free-text prompt fields, such as the research brief,
+with LLMLingua-2 before they are embedded in report prompts. It is a no-op unless
+the optional `llmlingua` package is installed and DEEP_RESEARCH_PROMPT_COMPRESSION=1
+is set. Do not use it on text with [Title](URL) citations: dropped tokens would
+mangle the links.
+"""
+
+import logging
+import os
+from functools import lru_cache
+
+try:
+    from llmlingua import PromptCompressor
+except ImportError:
+    PromptCompressor = None  # llmlingua not available, compression is disabled
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+
+COMPRESSION_MODEL = "microsoft/llmlingua-2-bert-base-multilingual-cased-meetingbank"
+COMPRESSION_RATE = 0.55
+# Keep line breaks and sentence punctuation so the report structure survives
+FORCE_TOKENS = ["\n", ".", ","]
+
+# ===== COMPRESSION FUNCTIONS =====
+
+@lru_cache(maxsize=1)
+def warn_llmlingua_missing() -> None:
+    """Warn once that compression was requested but llmlingua is not installed."""
+    logger.warning(
+        "DEEP_RESEARCH_PROMPT_COMPRESSION=1 is set but llmlingua is not installed; "
+        "prompts will not be compressed. Install the 'compression' extra to enable it."
+    )
+
+def is_compression_enabled() -> bool:
+    """Check whether prompt compression is switched on and installed."""
+    if os.getenv("DEEP_RESEARCH_PROMPT_COMPRESSION", "0") != "1":
+        return False
+    if PromptCompressor is None:
+        warn_llmlingua_missing()
+        return False
+    return True
+
+@lru_cache(maxsize=1)
+def get_compressor() -> "PromptCompressor":
+    """Load the LLMLingua-2 compressor once per process."""
+    return PromptCompressor(model_name=COMPRESSION_MODEL, use_llmlingua2=True, device_map="cpu")
+
+@lru_cache(maxsize=128)
+def run_compression(text: str) -> str:
+    """Compress text with LLMLingua-2, memoized since briefs repeat across iterations."""
+    result = get_compressor().compress_prompt(text, rate=COMPRESSION_RATE, force_tokens=FORCE_TOKENS)
+    return result["compressed_prompt"]
+
+def compress_text(text: str) -> str:
+    """Compress a free-text prompt field when compression is enabled.
+
+    Args:
+        text: Prompt field to compress
+
+    Returns:
+        Compressed text, or the original text when compression is disabled
+    """
+    if not text or not is_compression_enabled():
+        return text
+    return run_compression(text)
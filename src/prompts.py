@@ -436,16 +436,16 @@ This is critical. The user will only understand the answer if it is written in t
 
 Today's date is {date}.
 
-Here is the draft report:
-<Draft Report>
-{draft_report}
-</Draft Report>
-
 Here are the findings from the research that you conducted:
 <Findings>
 {findings}
 </Findings>
 
+Here is the draft report:
+<Draft Report>
+{draft_report}
+</Draft Report>
+
 Please create a detailed answer to the overall research brief that:
 1. Is well-organized with proper headings (# for title, ## for sections, ### for subsections)
 2. Includes specific facts and insights from the research
@@ -5,27 +5,94 @@ This module implements a research agent that can perform iterative web searches
 and synthesis to answer complex research questions.
 """
 
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
 from typing_extensions import Literal
 
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage
 from langchain.chat_models import init_chat_model
 
 from deep_research.state_research import ResearcherState, ResearcherOutputState
-from deep_research.utils import tavily_search, get_today_str, think_tool
+from deep_research.utils import tavily_search, get_today_str, think_tool, llm_cache
 from deep_research.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
 
 # ===== CONFIGURATION =====
 
 # Set up tools and model binding
 tools = [tavily_search, think_tool]
-tools_by_name = {tool.name: tool for tool in tools}
 
 # Initialize models
 model = init_chat_model(model="openai:gpt-5")
 model_with_tools = model.bind_tools(tools)
-summarization_model = init_chat_model(model="openai:gpt-5")
-compress_model = init_chat_model(model="openai:gpt-5", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
+compress_model = init_chat_model(model="openai:gpt-5", max_tokens=32000, cache=llm_cache) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
+
+# Recent tavily_search results keyed on the tool call arguments, so a query that
+# is re-issued within the session skips the search and summarization round-trip.
+# Entries expire after search_cache_ttl_seconds so a long-lived process does not
+# keep serving stale results. Researchers run concurrently under the supervisor,
+# hence the lock.
+max_search_cache_size = 256
+search_cache_ttl_seconds = 30 * 60
+search_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+search_cache_lock = threading.Lock()
+
+# ===== TOOL EXECUTION =====
+
+def cached_tavily_search(args: dict) -> str:
+    """Run tavily_search, serving repeated queries from the cache.
+
+    Args:
+        args: Tool call arguments emitted by the model
+
+    Returns:
+        Formatted search results
+    """
+    key = json.dumps(args, sort_keys=True)
+    with search_cache_lock:
+        entry = search_cache.get(key)
+        if entry is not None:
+            stored_at, observation = entry
+            if time.monotonic() - stored_at < search_cache_ttl_seconds:
+                search_cache.move_to_end(key)
+                return observation
+            del search_cache[key]
+
+    observation = tavily_search.invoke(args)
+
+    with search_cache_lock:
+        search_cache[key] = (time.monotonic(), observation)
+        search_cache.move_to_end(key)
+        if len(search_cache) > max_search_cache_size:
+            search_cache.popitem(last=False)
+
+    return observation
+
+# Tool name -> callable taking the tool call arguments, resolved once at import
+tool_handlers = {
+    tavily_search.name: cached_tavily_search,
+    think_tool.name: think_tool.invoke,
+}
+
+# ===== PROMPT HELPERS =====
+
+@lru_cache(maxsize=8)
+def get_system_message(prompt: str, date: str) -> SystemMessage:
+    """Build the system message for a prompt template, memoized per day.
+
+    Args:
+        prompt: System prompt template with a {date} placeholder
+        date: Today's date string from get_today_str()
+
+    Returns:
+        SystemMessage reused by every call made on the same day
+    """
+    return SystemMessage(content=prompt.format(date=date))
 
 # ===== AGENT NODES =====
 
@@ -41,24 +108,28 @@ def llm_call(state: ResearcherState):
     return {
         "researcher_messages": [
             model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt)] + state["researcher_messages"]
+                [get_system_message(research_agent_prompt, get_today_str())] + state["researcher_messages"]
             )
         ]
     }
 
-def tool_node(state: ResearcherState):
+async def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
+    Executes all tool calls from the previous LLM responses concurrently,
+    so several searches in one response cost the slowest call rather than
+    the sum of all of them.
     Returns updated state with tool execution results.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+    # Execute all tool calls in parallel; gather preserves tool call order
+    observations = await asyncio.gather(
+        *[
+            asyncio.to_thread(tool_handlers[tool_call["name"]], tool_call["args"])
+            for tool_call in tool_calls
+        ]
+    )
 
     # Create tool message outputs
     tool_outputs = [
@@ -78,21 +149,20 @@ def compress_research(state: ResearcherState) -> dict:
     a compressed summary suitable for the supervisor's decision-making.
     """
 
-    system_message = compress_research_system_prompt.format(date=get_today_str())
-    messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
+    system_message = get_system_message(compress_research_system_prompt, get_today_str())
+    messages = [system_message] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
     response = compress_model.invoke(messages)
 
     # Extract raw notes from tool and AI messages
     raw_notes = [
-        str(m.content) for m in filter_messages(
-            state["researcher_messages"], 
-            include_types=["tool", "ai"]
-        )
+        str(m.content) for m in state["researcher_messages"]
+        if m.type in ("tool", "ai")
     ]
 
     return {
         "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        # The supervisor joins these per researcher, so no need to join here
+        "raw_notes": raw_notes
     }
 
 # ===== ROUTING LOGIC =====
@@ -12,24 +12,97 @@ The system orchestrates the complete research workflow from initial user
 input through final report delivery.
 """
 
-from langchain_core.messages import HumanMessage
+import logging
+import os
+import re
+
+from langchain_core.messages import BaseMessage, HumanMessage
 from langgraph.graph import StateGraph, START, END
 
-from deep_research.utils import get_today_str
+from deep_research.utils import get_today_str, llm_cache
+from deep_research.prompt_compressor import compress_text
 from deep_research.prompts import final_report_generation_with_helpfulness_insightfulness_hit_citation_prompt
 from deep_research.state_scope import AgentState, AgentInputState
 from deep_research.research_agent_scope import clarify_with_user, write_research_brief, write_draft_report
 from deep_research.multi_agent_supervisor import supervisor_agent
 
+logger = logging.getLogger(__name__)
+
 # ===== Config =====
 
 from langchain.chat_models import init_chat_model
-writer_model = init_chat_model(model="openai:gpt-5", max_tokens=40000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
+writer_model = init_chat_model(model="openai:gpt-5", max_tokens=40000, cache=llm_cache) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
 
 # ===== FINAL REPORT GENERATION =====
 
 from deep_research.state_scope import AgentState
 
+# Compressed research ends with a sources section listing one citation per line
+SOURCES_HEADING = re.compile(
+    r"^\s*(?:#+\s*Sources|\*\*List of All Relevant Sources[^\n]*)\s*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+CITATION_LINE = re.compile(r"^\s*(?:[-*]\s*)?\[?\d+[\].)]")
+
+def summarize_research_result(research_topic: str, research: str) -> str:
+    """Collapse one researcher's findings to its topic and cited sources.
+
+    Args:
+        research_topic: Topic the supervisor delegated to the researcher
+        research: Compressed research returned by the researcher
+
+    Returns:
+        Single line with the topic, original size and every citation line
+    """
+    headings = list(SOURCES_HEADING.finditer(research))
+    sources = []
+    if headings:
+        sources = [
+            line.strip() for line in research[headings[-1].end():].splitlines()
+            if CITATION_LINE.match(line)
+        ]
+    summary = f"{research_topic[:120]} ({len(research)} chars)"
+    if sources:
+        summary += " | Sources: " + "; ".join(sources)
+    else:
+        logger.warning("No sources found while collapsing research on %r; its citations are dropped", research_topic[:120])
+    return summary
+
+def compress_research_findings(supervisor_messages: list[BaseMessage], keep_last: int = 5) -> str:
+    """Build report findings from research results, collapsing older ones.
+
+    Only ConductResearch results are kept: think_tool reflections are internal
+    reasoning, and refine_draft_report outputs are superseded by the latest
+    draft, which the report prompt already receives. The most recent research
+    results stay verbatim; older ones are collapsed to their topic and sources
+    so their citations remain available to the writer. Messages are not modified.
+
+    Args:
+        supervisor_messages: Supervisor message history, including tool calls and results
+        keep_last: Number of most recent research results to keep verbatim
+
+    Returns:
+        Findings string for the report prompt, empty if no research was conducted
+    """
+    research_topics = {
+        tool_call["id"]: tool_call["args"].get("research_topic", "")
+        for message in supervisor_messages if message.type == "ai"
+        for tool_call in message.tool_calls if tool_call["name"] == "ConductResearch"
+    }
+    research_results = [
+        message for message in supervisor_messages
+        if message.type == "tool" and message.name == "ConductResearch"
+    ]
+
+    split = max(len(research_results) - keep_last, 0)
+    collapsed = [
+        f"[research {i}] " + summarize_research_result(
+            research_topics.get(message.tool_call_id, ""), str(message.content)
+        )
+        for i, message in enumerate(research_results[:split], 1)
+    ]
+    return "\n".join(collapsed + [str(message.content) for message in research_results[split:]])
+
 async def final_report_generation(state: AgentState):
     """
     Final report generation node.
@@ -38,22 +111,31 @@ async def final_report_generation(state: AgentState):
     """
 
     notes = state.get("notes", [])
+    research_brief = state.get("research_brief", "")
+    draft_report = state.get("draft_report", "")
 
-    findings = "\n".join(notes)
+    # Opt-in: keep only research results and collapse older ones to cut writer
+    # prompt tokens; fall back to all notes if no research results are found
+    findings = ""
+    if os.getenv("DEEP_RESEARCH_PROGRESSIVE_COMPRESSION", "0") == "1":
+        findings = compress_research_findings(state.get("supervisor_messages", []))
+    if not findings:
+        findings = "\n".join(notes)
 
     final_report_prompt = final_report_generation_with_helpfulness_insightfulness_hit_citation_prompt.format(
-        research_brief=state.get("research_brief", ""),
+        research_brief=compress_text(research_brief),
         findings=findings,
         date=get_today_str(),
-        draft_report=state.get("draft_report", ""),
-        user_request=state.get("user_request", "")
+        # Not compressed: dropped tokens would mangle the draft's [Title](URL) citations
+        draft_report=draft_report
     )
 
     final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+    report_content = final_report.content
 
     return {
-        "final_report": final_report.content, 
-        "messages": ["Here is the final report: " + final_report.content],
+        "final_report": report_content, 
+        "messages": ["Here is the final report: " + report_content],
     }
 
 # ===== GRAPH CONSTRUCTION =====
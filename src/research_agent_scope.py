@@ -9,7 +9,6 @@ The workflow uses structured output to make deterministic decisions about
 whether sufficient context exists to proceed with research.
 """
 
-from datetime import datetime
 from typing_extensions import Literal
 
 from langchain.chat_models import init_chat_model
@@ -19,18 +18,20 @@ from langgraph.types import Command
 
 from deep_research.prompts import transform_messages_into_research_topic_human_msg_prompt, draft_report_generation_prompt, clarify_with_user_instructions
 from deep_research.state_scope import AgentState, ResearchQuestion, AgentInputState, DraftReport
-
-# ===== UTILITY FUNCTIONS =====
-
-def get_today_str() -> str:
-    """Get current date in a human-readable format."""
-    return datetime.now().strftime("%a %b %-d, %Y")
+from deep_research.utils import get_today_str, llm_cache
+from deep_research.prompt_compressor import compress_text
 
 # ===== CONFIGURATION =====
 
 # Initialize model
-model = init_chat_model(model="openai:gpt-5")
-creative_model = init_chat_model(model="openai:gpt-5")
+model = init_chat_model(model="openai:gpt-5", cache=llm_cache)
+creative_model = init_chat_model(model="openai:gpt-5", cache=llm_cache)
+
+# Structured output models, built once. json_schema mode uses the provider's
+# native strict structured outputs instead of a tool-call wrapper, so responses
+# are schema-valid in a single round-trip.
+research_brief_model = model.with_structured_output(ResearchQuestion, method="json_schema", strict=True)
+draft_report_model = creative_model.with_structured_output(DraftReport, method="json_schema", strict=True)
 
 # ===== WORKFLOW NODES =====
 
@@ -67,18 +68,15 @@ def clarify_with_user(state: AgentState) -> Command[Literal["write_research_brie
         goto="write_research_brief"
     )
 
-def write_research_brief(state: AgentState) -> Command[Literal["write_draft_report"]]:
+async def write_research_brief(state: AgentState) -> Command[Literal["write_draft_report"]]:
     """
     Transform the conversation history into a comprehensive research brief.
 
     Uses structured output to ensure the brief follows the required format
     and contains all necessary details for effective research.
     """
-    # Set up structured output model
-    structured_output_model = model.with_structured_output(ResearchQuestion)
-
     # Generate research brief from conversation history
-    response = structured_output_model.invoke([
+    response = await research_brief_model.ainvoke([
         HumanMessage(content=transform_messages_into_research_topic_human_msg_prompt.format(
             messages=get_buffer_string(state.get("messages", [])),
             date=get_today_str()
@@ -91,21 +89,19 @@ def write_research_brief(state: AgentState) -> Command[Literal["write_draft_repo
             update={"research_brief": response.research_brief}
         )
 
-def write_draft_report(state: AgentState) -> Command[Literal["__end__"]]:
+async def write_draft_report(state: AgentState) -> Command[Literal["__end__"]]:
     """
     Final report generation node.
 
     Synthesizes all research findings into a comprehensive final report
     """
-    # Set up structured output model
-    structured_output_model = creative_model.with_structured_output(DraftReport)
     research_brief = state.get("research_brief", "")
     draft_report_prompt = draft_report_generation_prompt.format(
-        research_brief=research_brief,
+        research_brief=compress_text(research_brief),
         date=get_today_str()
     )
 
-    response = structured_output_model.invoke([HumanMessage(content=draft_report_prompt)])
+    response = await draft_report_model.ainvoke([HumanMessage(content=draft_report_prompt)])
 
     return {
         "research_brief": research_brief,
@@ -6,18 +6,27 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import logging
+import os
 from pathlib import Path
 from datetime import datetime
-from typing_extensions import Annotated, List, Literal
+from functools import lru_cache
+from typing_extensions import Annotated, List, Literal, Optional
 
+import tiktoken
 from langchain.chat_models import init_chat_model 
+from langchain_core.caches import BaseCache
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langchain_core.tools import tool, InjectedToolArg
 from tavily import TavilyClient
 
 from deep_research.state_research import Summary
+from deep_research.prompt_compressor import compress_text
 from deep_research.prompts import summarize_webpage_prompt, report_generation_with_draft_insight_prompt
 
+logger = logging.getLogger(__name__)
+
 # ===== UTILITY FUNCTIONS =====
 
 def get_today_str() -> str:
@@ -37,12 +46,85 @@ def get_current_dir() -> Path:
     except NameError:  # __file__ is not defined
         return Path.cwd()
 
+def create_llm_cache() -> Optional[BaseCache]:
+    """Create the on-disk LLM response cache if it is enabled.
+
+    Set DEEP_RESEARCH_LLM_CACHE=1 to enable. Calls with an identical prompt and
+    model configuration are then served from a local SQLite database instead of
+    going back to the provider. DEEP_RESEARCH_LLM_CACHE_PATH overrides the
+    database location.
+
+    Returns:
+        SQLiteCache instance, or None when caching is disabled
+    """
+    if os.getenv("DEEP_RESEARCH_LLM_CACHE", "0") != "1":
+        return None
+
+    # Imported here so SQLAlchemy is only loaded when the cache is enabled
+    from langchain_community.cache import SQLiteCache
+
+    return SQLiteCache(
+        database_path=os.getenv("DEEP_RESEARCH_LLM_CACHE_PATH", ".deep_research_llm_cache.db")
+    )
+
+@lru_cache(maxsize=1)
+def get_token_encoder() -> Optional[tiktoken.Encoding]:
+    """Get the tokenizer used by the configured OpenAI models, loaded once.
+
+    The encoding's BPE file is downloaded on first use, so loading can fail
+    offline. The failure is cached as None so it is logged and attempted once.
+
+    Returns:
+        The o200k_base encoding, or None if it could not be loaded
+    """
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("Failed to load tokenizer, truncating by characters instead: %s", e)
+        return None
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget rather than a character count.
+
+    Character slicing over-includes for scripts that need several tokens per
+    character and under-includes for plain ASCII, so budget on tokens instead.
+    If the tokenizer is unavailable or fails, falls back to ~4 characters per
+    token so a search never fails on truncation.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+
+    Returns:
+        The text itself if it fits the budget, otherwise its longest token prefix
+    """
+    # Natural text averages well under 8 characters per token, so this bounds
+    # the encoding work on very large pages without cutting into the budget
+    text = text[:max_tokens * 8]
+    encoder = get_token_encoder()
+    if encoder is None:
+        return text[:max_tokens * 4]
+
+    try:
+        tokens = encoder.encode(text, disallowed_special=())
+    except Exception as e:
+        logger.warning("Failed to tokenize text, truncating by characters instead: %s", e)
+        return text[:max_tokens * 4]
+
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
 # ===== CONFIGURATION =====
 
-summarization_model = init_chat_model(model="openai:gpt-5")
-writer_model = init_chat_model(model="openai:gpt-5", max_tokens=32000)
+llm_cache = create_llm_cache()
+summarization_model = init_chat_model(model="openai:gpt-5", cache=llm_cache)
+# Structured summarizer shared by every webpage summary instead of rebuilt per page
+structured_summarization_model = summarization_model.with_structured_output(Summary)
+writer_model = init_chat_model(model="openai:gpt-5", max_tokens=32000, cache=llm_cache)
 tavily_client = TavilyClient()
-MAX_CONTEXT_LENGTH = 250000
+MAX_CONTEXT_TOKENS = 62500
+MAX_SUMMARIZATION_WORKERS = 8
 
 # ===== SEARCH FUNCTIONS =====
 
@@ -77,24 +159,22 @@ def tavily_search_multiple(
 
     return search_docs
 
-def summarize_webpage_content(webpage_content: str) -> str:
+def summarize_webpage_content(webpage_content: str, date: Optional[str] = None) -> str:
     """Summarize webpage content using the configured summarization model.
 
     Args:
         webpage_content: Raw webpage content to summarize
+        date: Date string for the prompt; defaults to get_today_str()
 
     Returns:
         Formatted summary with key excerpts
     """
     try:
-        # Set up structured output model for summarization
-        structured_model = summarization_model.with_structured_output(Summary)
-
         # Generate summary
-        summary = structured_model.invoke([
+        summary = structured_summarization_model.invoke([
             HumanMessage(content=summarize_webpage_prompt.format(
                 webpage_content=webpage_content, 
-                date=get_today_str()
+                date=date or get_today_str()
             ))
         ])
 
@@ -107,7 +187,7 @@ def summarize_webpage_content(webpage_content: str) -> str:
         return formatted_summary
 
     except Exception as e:
-        print(f"Failed to summarize webpage: {str(e)}")
+        logger.warning("Failed to summarize webpage: %s", e)
         return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
 
 def deduplicate_search_results(search_results: List[dict]) -> dict:
@@ -138,19 +218,29 @@ def process_search_results(unique_results: dict) -> dict:
     Returns:
         Dictionary of processed results with summaries
     """
+    today = get_today_str()
+
+    def summarize(raw_content: str) -> str:
+        return summarize_webpage_content(truncate_to_tokens(raw_content, MAX_CONTEXT_TOKENS), date=today)
+
+    # Summarize raw content for better processing. Each page is an independent
+    # LLM round-trip, so run them concurrently rather than one after another.
+    # ContextThreadPoolExecutor copies contextvars into each worker so the
+    # summarization calls stay attached to the calling tool's run (callbacks,
+    # tracing, message streaming).
+    pages = {url: result['raw_content'] for url, result in unique_results.items() if result.get("raw_content")}
+    summaries = {}
+    if pages:
+        with ContextThreadPoolExecutor(max_workers=min(len(pages), MAX_SUMMARIZATION_WORKERS)) as executor:
+            summaries = dict(zip(pages, executor.map(summarize, pages.values())))
+
     summarized_results = {}
 
     for url, result in unique_results.items():
-        # Use existing content if no raw content for summarization
-        if not result.get("raw_content"):
-            content = result['content']
-        else:
-            # Summarize raw content for better processing
-            content = summarize_webpage_content(result['raw_content'][:MAX_CONTEXT_LENGTH])
-
         summarized_results[url] = {
             'title': result['title'],
-            'content': content
+            # Use existing content if no raw content for summarization
+            'content': summaries[url] if url in summaries else result['content']
         }
 
     return summarized_results
@@ -167,15 +257,17 @@ def format_search_output(summarized_results: dict) -> str:
     if not summarized_results:
         return "No valid search results found. Please try different search queries or use a different search API."
 
-    formatted_output = "Search results: \n\n"
-
-    for i, (url, result) in enumerate(summarized_results.items(), 1):
-        formatted_output += f"\n\n--- SOURCE {i}: {result['title']} ---\n"
-        formatted_output += f"URL: {url}\n\n"
-        formatted_output += f"SUMMARY:\n{result['content']}\n\n"
-        formatted_output += "-" * 80 + "\n"
+    separator = "-" * 80 + "\n"
+    sections = ["Search results: \n\n"]
+    sections.extend(
+        f"\n\n--- SOURCE {i}: {result['title']} ---\n"
+        f"URL: {url}\n\n"
+        f"SUMMARY:\n{result['content']}\n\n"
+        f"{separator}"
+        for i, (url, result) in enumerate(summarized_results.items(), 1)
+    )
 
-    return formatted_output
+    return "".join(sections)
 
 # ===== RESEARCH TOOLS =====
 
@@ -256,8 +348,10 @@ def refine_draft_report(research_brief: Annotated[str, InjectedToolArg],
         refined draft report
     """
 
+    # Only the brief is compressed: the draft is rewritten on every refine step,
+    # so compressing it here would compound the loss across iterations
     draft_report_prompt = report_generation_with_draft_insight_prompt.format(
-        research_brief=research_brief,
+        research_brief=compress_text(research_brief),
         findings=findings,
         draft_report=draft_report,
         date=get_today_str()
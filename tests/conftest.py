@@ -0,0 +1,6 @@
+import os
+
+# The agent modules build OpenAI and Tavily clients at import time; dummy keys
+# let them import without network access. No test makes a real API call.
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("TAVILY_API_KEY", "test")
@@ -0,0 +1,77 @@
+import logging
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from deep_research.research_agent_full import compress_research_findings, summarize_research_result
+
+MARKDOWN_RESEARCH = """## Findings
+Battery prices fell sharply [1] while deployments grew [2].
+
+### Sources
+[1] BNEF Outlook: https://example.com/bnef
+[2] IEA Report: https://example.com/iea
+"""
+
+BOLD_RESEARCH = """**Queries and Tool Calls Made**
+Searched for heat pump adoption.
+
+**List of All Relevant Sources (with citations in the report)**
+1. Heat Pump Survey: https://example.com/survey
+2. Grid Study: https://example.com/grid
+"""
+
+
+def test_summarize_markdown_sources_heading():
+    summary = summarize_research_result("Battery storage costs", MARKDOWN_RESEARCH)
+
+    assert summary == (
+        f"Battery storage costs ({len(MARKDOWN_RESEARCH)} chars) | Sources: "
+        "[1] BNEF Outlook: https://example.com/bnef; [2] IEA Report: https://example.com/iea"
+    )
+
+
+def test_summarize_bold_sources_heading():
+    summary = summarize_research_result("Heat pump adoption", BOLD_RESEARCH)
+
+    assert summary.endswith(
+        "| Sources: 1. Heat Pump Survey: https://example.com/survey; 2. Grid Study: https://example.com/grid"
+    )
+
+
+def test_summarize_without_sources_logs_warning(caplog):
+    research = "Nothing useful was found for this topic."
+
+    with caplog.at_level(logging.WARNING, logger="deep_research.research_agent_full"):
+        summary = summarize_research_result("Obscure topic", research)
+
+    assert summary == f"Obscure topic ({len(research)} chars)"
+    assert "Obscure topic" in caplog.text
+
+
+def research_round(index):
+    call_id = f"call_{index}"
+    return [
+        AIMessage(content="", tool_calls=[
+            {"name": "ConductResearch", "args": {"research_topic": f"topic {index}"}, "id": call_id},
+            {"name": "think_tool", "args": {"reflection": "plan"}, "id": f"think_{index}"},
+        ]),
+        ToolMessage(content=MARKDOWN_RESEARCH.replace("Battery", f"Round {index}"), name="ConductResearch", tool_call_id=call_id),
+        ToolMessage(content=f"Reflection recorded {index}", name="think_tool", tool_call_id=f"think_{index}"),
+        ToolMessage(content=f"Draft {index}", name="refine_draft_report", tool_call_id=f"refine_{index}"),
+    ]
+
+
+def test_compress_findings_collapses_older_results():
+    messages = [message for index in range(1, 4) for message in research_round(index)]
+
+    findings = compress_research_findings(messages, keep_last=1)
+
+    assert "Reflection recorded" not in findings
+    assert "Draft" not in findings
+    assert findings.startswith("[research 1] topic 1 (")
+    assert "[research 2] topic 2 (" in findings
+    assert findings.endswith(MARKDOWN_RESEARCH.replace("Battery", "Round 3"))
+
+
+def test_compress_findings_without_research_is_empty():
+    assert compress_research_findings([]) == ""